@@ -0,0 +1,261 @@
+"""Script to post content to Bluesky."""
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from dotenv import load_dotenv
+from post_finder import find_post_and_media, prune_downloads
+from src.utils import setup_file_logger
+from io import BytesIO
+
+# Set up logging on this module's own logger (see setup_file_logger)
+logger = setup_file_logger(__name__, 'logs/bluesky.log')
+
+# Bluesky's recommended image frame (16:9)
+TARGET_WIDTH = 1200
+TARGET_HEIGHT = 675
+
+# Image modes resized and saved as JPEG without conversion (RGBA is
+# flattened to RGB separately). CMYK is deliberately left out: many clients
+# render CMYK JPEGs with inverted or washed-out colours.
+_JPEG_MODES = frozenset(('RGB', 'L', 'RGBA'))
+
+# Rough upper bound on a q85 JPEG of the target frame (~3 bits/pixel)
+JPEG_BUFFER_SIZE = TARGET_WIDTH * TARGET_HEIGHT * 3 // 8
+
+# Cached session string, reused across runs to skip a fresh login
+SESSION_FILE = os.path.expanduser('~/.cache/bsky_session')
+
+# Shared client so its HTTP connection pool is reused across calls
+_client = None
+
+def process_image(image_path):
+    """Process image for Bluesky upload.
+
+    Returns:
+        Tuple of (JPEG bytes, (width, height)) or None on failure
+    """
+    # Imported lazily so importing this module doesn't pay for Pillow
+    from PIL import Image
+
+    try:
+        logger.info(f"Processing image: {image_path}")
+        with Image.open(image_path) as img:
+            # Let libjpeg scale large JPEGs down by 1/2, 1/4 or 1/8 while
+            # decoding, leaving headroom above the target for Lanczos
+            if img.format == 'JPEG':
+                img.draft('RGB', (TARGET_WIDTH * 2, TARGET_HEIGHT * 2))
+
+            # Palette images can't be resampled with Lanczos, so expand them;
+            # greyscale/palette images with alpha go the same way so their
+            # transparency is flattened below
+            if img.mode in ('P', 'LA', 'PA'):
+                img = img.convert('RGBA')
+            # Everything else (CMYK, 16-bit or float images, ...) is either
+            # rejected by the JPEG encoder or resampler, or renders badly
+            # once uploaded, so convert it to RGB before resizing
+            elif img.mode not in _JPEG_MODES:
+                img = img.convert('RGB')
+
+            # Scale down to fit Bluesky's recommended 16:9 frame, keeping the
+            # original aspect ratio (reported to Bluesky via aspectRatio).
+            # Images that already fit (common for thumbnails and memes) skip
+            # resampling entirely; larger ones are box-filtered down to ~3x
+            # the target (reducing_gap) before the Lanczos pass.
+            if img.width > TARGET_WIDTH or img.height > TARGET_HEIGHT:
+                img.thumbnail(
+                    (TARGET_WIDTH, TARGET_HEIGHT),
+                    Image.Resampling.LANCZOS,
+                    reducing_gap=3.0
+                )
+
+            # Flatten transparency onto white in a single masked paste, on the
+            # already-downscaled image
+            if img.mode == 'RGBA':
+                flattened = Image.new('RGB', img.size, 'white')
+                flattened.paste(img, (0, 0), img)
+                img = flattened
+
+            # Convert to bytes (single-pass baseline encode, 4:2:0 chroma).
+            # Preallocate roughly the encoded size so the buffer doesn't keep
+            # reallocating as the encoder writes.
+            img_byte_arr = BytesIO(bytearray(JPEG_BUFFER_SIZE))
+            img.save(
+                img_byte_arr,
+                format='JPEG',
+                quality=85,
+                optimize=False,
+                progressive=False,
+                subsampling='4:2:0'
+            )
+            img_byte_arr.truncate()
+            # upload_blob hands the data to httpx, which only accepts bytes
+            # (a memoryview would be iterated as ints), so take one copy here
+            # and release the buffer straight away
+            img_data = img_byte_arr.getvalue()
+            del img_byte_arr
+            logger.info("Successfully processed image")
+            return img_data, img.size
+    except Exception as e:
+        logger.error(f"Error processing image: {str(e)}")
+        return None
+
+def cleanup_post(post_dir):
+    """Remove the directory of a post that has been published.
+    
+    Its date directory is removed too once it has no posts left.
+    """
+    try:
+        if os.path.exists(post_dir):
+            shutil.rmtree(post_dir)
+            logger.info(f"Cleaned up post directory {post_dir}")
+        try:
+            os.rmdir(os.path.dirname(post_dir))  # Only succeeds when it's empty
+        except OSError:
+            pass
+    except Exception as e:
+        logger.error(f"Error cleaning up post directory {post_dir}: {str(e)}")
+        raise  # Re-raise the exception to ensure it's logged in the scheduler
+
+def save_session(client):
+    """Persist the current Bluesky session so later runs can resume it."""
+    try:
+        os.makedirs(os.path.dirname(SESSION_FILE), exist_ok=True)
+        # The session holds access and refresh tokens, so keep it private to
+        # the owner (fchmod also tightens a file left by an older version)
+        fd = os.open(SESSION_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        os.fchmod(fd, 0o600)
+        with open(fd, 'w') as f:
+            f.write(client.export_session_string())
+    except Exception as e:
+        logger.warning(f"Could not save Bluesky session: {str(e)}")
+
+def login(client, email, password):
+    """Log in to Bluesky, resuming a cached session when possible."""
+    if client.me is not None:
+        return  # Already logged in during this process
+
+    if os.path.exists(SESSION_FILE):
+        try:
+            with open(SESSION_FILE, 'r') as f:
+                client.login(session_string=f.read())
+            logger.info(f"Resumed cached session for {email}")
+            return
+        except Exception as e:
+            logger.warning(f"Could not resume cached session: {str(e)}")
+
+    client.login(email, password)
+    save_session(client)
+    logger.info(f"Successfully logged in as {email}")
+
+def get_client():
+    """Return the shared Bluesky client, creating it on first use."""
+    global _client
+    if _client is None:
+        # Imported lazily; atproto pulls in a large number of modules
+        from atproto import Client
+
+        _client = Client()
+        # Keep the cached session current when tokens are refreshed
+        _client.on_session_change(lambda event, session: save_session(_client))
+    return _client
+
+def main():
+    """Main function to login to Bluesky and post content."""
+    try:
+        # Load environment variables
+        load_dotenv()
+        
+        # Get Bluesky credentials
+        bluesky_email = os.getenv('BLUESKY_EMAIL')
+        bluesky_password = os.getenv('BLUESKY_APP_PASSWORD')
+        
+        if not bluesky_email or not bluesky_password:
+            logger.error("Bluesky credentials not found in .env file")
+            raise ValueError("Missing Bluesky credentials")
+        
+        client = get_client()
+        try:
+            # Drop downloads that can never be posted so they don't pile up
+            prune_downloads()
+            
+            # Find post content and media
+            result = find_post_and_media()
+            if not result:
+                logger.info("No post content found")
+                return
+                
+            content, media_file, post_dir = result
+            logger.info(f"Found content and media: {bool(media_file)}")
+            
+            # Process the image in the background while the login round trip
+            # is in flight
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                image_future = None
+                if media_file:
+                    logger.info(f"Processing image: {media_file.name}")
+                    image_future = executor.submit(process_image, media_file)
+                
+                # Create or resume session
+                login(client, bluesky_email, bluesky_password)
+            
+            if image_future:
+                processed = image_future.result()
+                if not processed:
+                    logger.error("Failed to process image")
+                    raise RuntimeError("Image processing failed")
+                img_data, (img_width, img_height) = processed
+
+                try:
+                    # Upload image - fixed to use correct API
+                    img_upload = client.upload_blob(img_data)
+                    logger.info("Successfully uploaded image")
+
+                    # Create post with image
+                    embed = {
+                        '$type': 'app.bsky.embed.images',
+                        'images': [{
+                            'alt': 'Post image',
+                            'image': img_upload.blob,
+                            'aspectRatio': {
+                                'width': img_width,
+                                'height': img_height
+                            }
+                        }]
+                    }
+                    
+                    # Attempt to create post
+                    response = client.send_post(text=content, embed=embed)
+                    if response and hasattr(response, 'uri'):
+                        logger.info(f"Successfully created post: {response.uri}")
+                    else:
+                        logger.error("Failed to create post - no URI in response")
+                        raise RuntimeError("Post creation failed")
+                except Exception as e:
+                    logger.error(f"Error creating post: {str(e)}")
+                    raise
+            else:
+                # Create text-only post
+                try:
+                    response = client.send_post(text=content)
+                    if response and hasattr(response, 'uri'):
+                        logger.info(f"Successfully created text post: {response.uri}")
+                    else:
+                        logger.error("Failed to create text post - no URI in response")
+                        raise RuntimeError("Text post creation failed")
+                except Exception as e:
+                    logger.error(f"Error creating text post: {str(e)}")
+                    raise
+            
+            # Clean up the published post's directory
+            cleanup_post(post_dir)
+            
+        except Exception as e:
+            logger.error(f"Error during Bluesky operations: {str(e)}")
+            raise
+            
+    except Exception as e:
+        logger.error(f"Fatal error: {str(e)}")
+        raise  # Re-raise to ensure the scheduler sees the error
+
+if __name__ == '__main__':
+    main()
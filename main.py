@@ -1,67 +1,36 @@
-import subprocess
-import time
-import logging
 import sys
-import os
 
-# Ensure logs directory exists
-os.makedirs('logs', exist_ok=True)
+from src.utils import setup_file_logger
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('logs/scheduler.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
-logger = logging.getLogger(__name__)
+# The scheduler logs through its own logger (see setup_file_logger)
+logger = setup_file_logger('scheduler', 'logs/scheduler.log', sys.stdout)
 
-def run_script(script_name):
-    """Run a Python script and handle its output."""
-    logger.info(f"Starting {script_name}...")
+def run_step(step_name, func):
+    """Run a pipeline step in-process and report whether it succeeded."""
+    logger.info(f"Starting {step_name}...")
     
     try:
-        result = subprocess.run(
-            ['python', script_name],
-            capture_output=True,
-            text=True
-        )
-        
-        # Log stdout if there is any
-        if result.stdout:
-            for line in result.stdout.splitlines():
-                logger.info(f"{script_name} output: {line}")
-        
-        # Log stderr if there is any
-        if result.stderr:
-            for line in result.stderr.splitlines():
-                logger.error(f"{script_name} error: {line}")
-        
-        if result.returncode == 0:
-            logger.info(f"{script_name} completed successfully")
-            return True
-        else:
-            logger.error(f"{script_name} failed with return code {result.returncode}")
-            return False
-            
+        func()
+        logger.info(f"{step_name} completed successfully")
+        return True
     except Exception as e:
-        logger.error(f"Error running {script_name}: {str(e)}")
+        logger.error(f"{step_name} failed: {str(e)}")
         return False
 
 def run_scripts():
-    """Run both scripts in sequence."""
+    """Run both steps in sequence within this process."""
     try:
-        # Run reddit-main.py
-        if not run_script('reddit-main.py'):
-            return False
+        # Imported here so the scripts' module-level setup only runs when
+        # the pipeline does
+        import reddit_main
+        import bluesky_main
 
-        # Wait a bit to ensure files are written
-        time.sleep(5)
+        # Download content from Reddit
+        if not run_step('reddit_main', reddit_main.main):
+            return False
 
-        # Run bluesky-main.py
-        if not run_script('bluesky-main.py'):
+        # Post downloaded content to Bluesky
+        if not run_step('bluesky_main', bluesky_main.main):
             return False
 
         return True
@@ -1,26 +1,32 @@
 """Script to find post summaries and media files in the downloads directory."""
 import os
-import logging
+import shutil
+from datetime import date, timedelta
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Iterator, List, Optional, Tuple
+from src.utils import setup_file_logger
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('post_finder.log'),
-        logging.StreamHandler()
-    ]
-)
-logger = logging.getLogger(__name__)
+# Set up logging on this module's own logger (see setup_file_logger)
+logger = setup_file_logger(__name__, 'post_finder.log')
 
-def find_post_and_media() -> Optional[Tuple[str, Optional[Path]]]:
+# Unposted downloads older than this are pruned rather than published late
+MAX_POST_AGE_DAYS = 7
+
+def _date_dirs_newest_first(downloads_dir: Path) -> List[Path]:
+    """List the downloads/<YYYY-MM-DD> directories, most recent date first."""
+    return sorted((p for p in downloads_dir.iterdir() if p.is_dir()), reverse=True)
+
+def _iter_summary_files(downloads_dir: Path) -> Iterator[Path]:
+    """Yield post summaries, from the newest date directory to the oldest."""
+    for date_dir in _date_dirs_newest_first(downloads_dir):
+        yield from date_dir.rglob("post-summary.txt")
+
+def find_post_and_media() -> Optional[Tuple[str, Optional[Path], Path]]:
     """Recursively find post-summary.txt and associated media files.
     
     Returns:
-        Tuple containing the post content and path to media file (if exists)
-        or None if no post summary is found
+        Tuple containing the post content, path to media file (if exists)
+        and the post's directory, or None if no post summary is found
     """
     downloads_dir = Path("downloads")
     
@@ -30,56 +36,106 @@ def find_post_and_media() -> Optional[Tuple[str, Optional[Path]]]:
     
     logger.info(f"Searching for content in {downloads_dir}")
     
-    # Walk through all subdirectories in downloads
-    for root, dirs, files in os.walk(downloads_dir):
-        root_path = Path(root)
+    # Search the date directories for post summaries, newest first, so
+    # today's posts go out before leftovers from earlier runs
+    for summary_file in _iter_summary_files(downloads_dir):
+        root_path = summary_file.parent
         logger.debug(f"Checking directory: {root_path}")
         
-        # Check if post-summary.txt exists in current directory
-        summary_file = root_path / "post-summary.txt"
-        if summary_file.exists():
+        try:
+            # Read the summary content
+            with open(summary_file, 'r', encoding='utf-8') as f:
+                summary_content = f.read().strip()
+            
+            if not summary_content:
+                logger.warning(f"Empty content in {summary_file}")
+                continue
+            
+            logger.info(f"Found post summary in {summary_file}")
+            
+            # Look for media file
+            media_file = None
+            media_dir = root_path / "media"
             try:
-                # Read the summary content
-                with open(summary_file, 'r', encoding='utf-8') as f:
-                    summary_content = f.read().strip()
-                
-                if not summary_content:
-                    logger.warning(f"Empty content in {summary_file}")
-                    continue
-                
-                logger.info(f"Found post summary in {summary_file}")
-                
-                # Look for media file
-                media_file = None
-                media_dir = root_path / "media"
-                if media_dir.exists() and media_dir.is_dir():
-                    media_files = list(media_dir.glob('*'))
-                    if media_files:
-                        media_file = media_files[0]  # Get the first media file
-                        logger.info(f"Found media file: {media_file.name}")
-                    else:
-                        logger.info("No media files found in media directory")
+                with os.scandir(media_dir) as entries:
+                    # Get the first media file
+                    entry = next((e for e in entries if e.is_file()), None)
+                if entry:
+                    media_file = Path(entry.path)
+                    logger.info(f"Found media file: {media_file.name}")
                 else:
-                    logger.info("No media directory found")
-                
-                # Verify the media file exists and is readable
-                if media_file and not media_file.exists():
-                    logger.error(f"Media file {media_file} no longer exists")
-                    media_file = None
-                
-                return summary_content, media_file
-                
-            except Exception as e:
-                logger.error(f"Error reading {summary_file}: {str(e)}")
-                return None
-    
+                    logger.info("No media files found in media directory")
+            except (FileNotFoundError, NotADirectoryError):
+                logger.info("No media directory found")
+            
+            # Verify the media file exists and is readable
+            if media_file and not media_file.exists():
+                logger.error(f"Media file {media_file} no longer exists")
+                media_file = None
+            
+            return summary_content, media_file, root_path
+            
+        except Exception as e:
+            logger.error(f"Error reading {summary_file}: {str(e)}")
+            return None
+
     logger.warning("No post summary found in any subdirectory")
     return None
 
+def _has_summary(post_dir: str) -> bool:
+    """Check whether a post directory has a non-empty post-summary.txt."""
+    try:
+        with open(os.path.join(post_dir, "post-summary.txt"), 'r', encoding='utf-8') as f:
+            return bool(f.read().strip())
+    except OSError:
+        return False
+
+def prune_downloads() -> None:
+    """Remove post directories that should never be published.
+    
+    Posts are downloaded to downloads/<YYYY-MM-DD>/<subreddit>_<id>. Date
+    directories older than MAX_POST_AGE_DAYS are deleted outright. In the
+    rest, post directories without a non-empty post-summary.txt are deleted
+    (find_post_and_media never returns them; posts downloaded without
+    comments never get one), along with date directories left empty.
+    """
+    downloads_dir = Path("downloads")
+    if not downloads_dir.is_dir():
+        return
+    
+    cutoff = (date.today() - timedelta(days=MAX_POST_AGE_DAYS)).isoformat()
+    
+    for date_dir in _date_dirs_newest_first(downloads_dir):
+        # ISO dates compare correctly as strings
+        if date_dir.name < cutoff:
+            try:
+                shutil.rmtree(date_dir)
+                logger.info(f"Removed expired date directory {date_dir}")
+            except OSError as e:
+                logger.error(f"Error removing {date_dir}: {str(e)}")
+            continue
+        
+        with os.scandir(date_dir) as post_entries:
+            post_dirs = [e.path for e in post_entries if e.is_dir(follow_symlinks=False)]
+        
+        for post_dir in post_dirs:
+            if not _has_summary(post_dir):
+                try:
+                    shutil.rmtree(post_dir)
+                    logger.info(f"Removed unpublishable post directory {post_dir}")
+                except OSError as e:
+                    logger.error(f"Error removing {post_dir}: {str(e)}")
+        
+        try:
+            os.rmdir(date_dir)  # Only succeeds when it's empty
+            logger.info(f"Removed empty date directory {date_dir}")
+        except OSError:
+            pass
+
 if __name__ == "__main__":
     result = find_post_and_media()
     if result:
-        content, media = result
+        content, media, _ = result
         logger.info("\nFound post summary:")
         logger.info(f"Content: {content}")
         if media:
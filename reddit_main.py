@@ -2,27 +2,48 @@ import os
 import yaml
 import logging
 import logging.config
-from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, Tuple
 from dotenv import load_dotenv
 
 from src.reddit.config import RedditCredentials, SubredditConfig, GlobalConfig
 from src.reddit.handler import RedditHandler
+from src.reddit.models import RedditPost, DownloadResult
 from src.reddit.exceptions import ValidationError
 
+# Prefer the libyaml C parser when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+# Parsed YAML keyed on (path, mtime), so repeated runs in one process only
+# re-parse files that changed on disk
+_YAML_CACHE: Dict[Tuple[str, int], Any] = {}
+
+def _load_yaml(path: str) -> Any:
+    """Load a YAML file, reusing the parsed result if it hasn't changed."""
+    key = (path, os.stat(path).st_mtime_ns)
+    if key not in _YAML_CACHE:
+        with open(path, 'r') as f:
+            _YAML_CACHE[key] = yaml.load(f, Loader=_Loader)
+    return _YAML_CACHE[key]
+
 def load_config(config_path: str = "config.yaml", subreddits_path: str = "subreddits.yaml") -> tuple[Dict[str, Any], Dict[str, Any]]:
     """
     Load configuration from YAML files.
     
+    Parsed data is cached and shared between calls, so callers must not
+    mutate it.
+    
     Returns:
         tuple: (global_config_data, subreddits_config_data)
     """
     # Load global configuration
-    with open(config_path, 'r') as f:
-        global_config = yaml.safe_load(f)
+    global_config = _load_yaml(config_path)
     
     # Load subreddit configurations
-    with open(subreddits_path, 'r') as f:
-        subreddits_config = yaml.safe_load(f)
+    subreddits_config = _load_yaml(subreddits_path)
     
     return global_config, subreddits_config
 
@@ -31,6 +52,13 @@ def setup_logging(config: GlobalConfig) -> None:
     os.makedirs('logs', exist_ok=True)
     logging.config.dictConfig(config.logging_config)
 
+def download_post(handler: RedditHandler, post: RedditPost, position: int, total: int,
+                  output_dir: str, config: SubredditConfig) -> DownloadResult:
+    """Download one post's content on a worker thread, logging when it starts."""
+    logging.getLogger().info(f"Processing post {position}/{total}: {post.title[:50]}...")
+    # Pass both post and config to download_content
+    return handler.download_content(post, output_dir, config)
+
 def main() -> None:
     """Main entry point for the Reddit content downloader."""
     # Load environment variables
@@ -49,9 +77,8 @@ def main() -> None:
         logger.info("Loading configuration")
         global_config_data, subreddits_config = load_config()
         
-        # Create and validate global configuration
+        # Create global configuration (validated on construction)
         global_config = GlobalConfig(**global_config_data.get('settings', {}))
-        global_config.validate()
         
         # Set up logging with full configuration
         setup_logging(global_config)
@@ -66,7 +93,7 @@ def main() -> None:
         
         # Initialize Reddit handler
         logger.info("Initializing Reddit handler")
-        handler = RedditHandler()
+        handler = RedditHandler(use_json_api=global_config.use_json_api)
         
         # Process each subreddit configuration
         logger.info("Validating configuration")
@@ -75,7 +102,6 @@ def main() -> None:
             try:
                 logger.info(f"Validating configuration for subreddit: {subreddit_data.get('name')}")
                 subreddit_config = SubredditConfig(**subreddit_data)
-                subreddit_config.validate()
                 subreddits.append(subreddit_config)
                 logger.info(f"Configuration for subreddit {subreddit_data.get('name')} is valid")
             except ValidationError as e:
@@ -92,26 +118,38 @@ def main() -> None:
                 posts = handler.get_subreddit_posts(config)
                 logger.info(f"Found {len(posts)} posts")
                 
-                # Download content for each post
-                for i, post in enumerate(posts, 1):
-                    logger.info(f"Processing post {i}/{len(posts)}: {post.title[:50]}...")
-                    try:
-                        # Pass both post and config to download_content
-                        result = handler.download_content(post, global_config.output_dir, config)
-                        if result.success:
-                            if result.downloaded_files:
-                                logger.info(f"Successfully downloaded {len(result.downloaded_files)} files")
-                                for file in result.downloaded_files:
-                                    logger.debug(f"Downloaded: {file}")
+                # Download content for each post; downloads are network-bound,
+                # so overlap up to batch_size of them on worker threads
+                if not posts:
+                    continue
+                with ThreadPoolExecutor(max_workers=min(config.batch_size, len(posts))) as executor:
+                    futures = {}
+                    for i, post in enumerate(posts, 1):
+                        future = executor.submit(
+                            download_post, handler, post, i, len(posts), global_config.output_dir, config
+                        )
+                        futures[future] = post
+                    
+                    for future in as_completed(futures):
+                        post = futures[future]
+                        try:
+                            result = future.result()
+                            if result.success:
+                                if result.downloaded_files:
+                                    logger.info(f"Successfully downloaded {len(result.downloaded_files)} files for post {post.id}")
+                                    if logger.isEnabledFor(logging.DEBUG):
+                                        logger.debug("Downloaded:\n" + "\n".join(result.downloaded_files))
+                                else:
+                                    logger.info(f"No files to download for post {post.id}")
                             else:
-                                logger.info("No files to download")
-                        else:
-                            logger.warning("Errors occurred while downloading:")
-                            for error in result.errors:
-                                logger.error(f"  {error}")
-                    except Exception as e:
-                        logger.error(f"Error downloading content: {str(e)}")
-                        continue
+                                logger.warning(f"Errors occurred while downloading post {post.id}:")
+                                logger.error("  " + "\n  ".join(result.errors))
+                        except Exception as e:
+                            logger.error(f"Error downloading content for post {post.id}: {str(e)}")
+                            continue
+                
+                # Remember processed posts so the next run skips them
+                handler.save_seen_posts()
                 
             except Exception as e:
                 logger.error(f"Error processing subreddit r/{config.name}: {str(e)}")
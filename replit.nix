@@ -6,5 +6,7 @@
     pkgs.libxcrypt
     pkgs.libiconv
     pkgs.cargo
+    pkgs.zlib
+    pkgs.libjpeg_turbo
   ];
 }
@@ -2,6 +2,68 @@ from dataclasses import dataclass
 from typing import Optional, List
 from .exceptions import ValidationError
 
+# Default logging configuration. Shared by every GlobalConfig that doesn't
+# supply its own, so it must be treated as read-only.
+_DEFAULT_LOGGING_CONFIG = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'standard': {
+            'format': '%(asctime)s - %(levelname)s - %(message)s'
+        },
+    },
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+            'formatter': 'standard',
+            'level': 'INFO',
+        },
+        'file': {
+            'class': 'logging.handlers.RotatingFileHandler',
+            'filename': 'logs/reddit_downloader.log',
+            'formatter': 'standard',
+            'level': 'INFO',
+            'maxBytes': 10485760,  # 10MB
+            'backupCount': 5,
+        },
+    },
+    'loggers': {
+        '': {
+            'handlers': ['console', 'file'],
+            'level': 'INFO',
+            'propagate': True
+        }
+    }
+}
+
+# Accepted filter_type/time_filter values (also used by src.utils.validators)
+FILTER_TYPES = ('hot', 'new', 'top', 'rising')
+TIME_FILTERS = ('all', 'day', 'hour', 'month', 'week', 'year')
+VALID_FILTER_TYPES = frozenset(FILTER_TYPES)
+VALID_TIME_FILTERS = frozenset(TIME_FILTERS)
+
+# (predicate, error message) pairs checked in order by SubredditConfig.validate
+_SUBREDDIT_CHECKS = (
+    (lambda c: bool(c.name), "Subreddit name is required"),
+    (lambda c: c.filter_type in VALID_FILTER_TYPES,
+     f"Invalid filter type. Must be one of: {', '.join(FILTER_TYPES)}"),
+    (lambda c: c.filter_type != 'top' or c.time_filter in VALID_TIME_FILTERS,
+     f"Time filter is required for top posts. Must be one of: {', '.join(TIME_FILTERS)}"),
+    (lambda c: c.limit >= 1, "Limit must be greater than 0"),
+    (lambda c: c.batch_size >= 1, "Batch size must be greater than 0"),
+    (lambda c: c.timeout >= 1, "Timeout must be greater than 0"),
+    (lambda c: c.max_comments >= 0, "Max comments must be greater than or equal to 0"),
+)
+
+# (predicate, error message) pairs checked in order by GlobalConfig.validate
+_GLOBAL_CHECKS = (
+    (lambda c: bool(c.output_dir), "Output directory is required"),
+    (lambda c: c.default_batch_size >= 1, "Default batch size must be greater than 0"),
+    (lambda c: c.default_timeout >= 1, "Default timeout must be greater than 0"),
+    (lambda c: c.max_retries >= 0, "Max retries must be greater than or equal to 0"),
+    (lambda c: c.retry_delay >= 0, "Retry delay must be greater than or equal to 0"),
+)
+
 @dataclass
 class RedditCredentials:
     """Reddit API credentials configuration."""
@@ -32,31 +94,15 @@ class SubredditConfig:
     batch_size: int = 5
     timeout: int = 30
 
+    def __post_init__(self):
+        """Validate as soon as the configuration is created."""
+        self.validate()
+
     def validate(self) -> None:
         """Validate subreddit configuration."""
-        if not self.name:
-            raise ValidationError("Subreddit name is required")
-        
-        valid_filter_types = ['hot', 'new', 'top', 'rising']
-        if self.filter_type not in valid_filter_types:
-            raise ValidationError(f"Invalid filter type. Must be one of: {', '.join(valid_filter_types)}")
-        
-        if self.filter_type == 'top':
-            valid_time_filters = ['all', 'day', 'hour', 'month', 'week', 'year']
-            if not self.time_filter or self.time_filter not in valid_time_filters:
-                raise ValidationError(f"Time filter is required for top posts. Must be one of: {', '.join(valid_time_filters)}")
-        
-        if self.limit < 1:
-            raise ValidationError("Limit must be greater than 0")
-        
-        if self.batch_size < 1:
-            raise ValidationError("Batch size must be greater than 0")
-        
-        if self.timeout < 1:
-            raise ValidationError("Timeout must be greater than 0")
-            
-        if self.max_comments < 0:
-            raise ValidationError("Max comments must be greater than or equal to 0")
+        for check, message in _SUBREDDIT_CHECKS:
+            if not check(self):
+                raise ValidationError(message)
 
 @dataclass
 class GlobalConfig:
@@ -67,51 +113,16 @@ class GlobalConfig:
     default_timeout: int = 30
     max_retries: int = 3
     retry_delay: int = 5
+    use_json_api: bool = False  # Fetch listings via Reddit's JSON API instead of PRAW
 
     def __post_init__(self):
-        """Set default logging configuration if none provided."""
+        """Set default logging configuration if none provided, then validate."""
         if self.logging_config is None:
-            self.logging_config = {
-                'version': 1,
-                'disable_existing_loggers': False,
-                'formatters': {
-                    'standard': {
-                        'format': '%(asctime)s - %(levelname)s - %(message)s'
-                    },
-                },
-                'handlers': {
-                    'console': {
-                        'class': 'logging.StreamHandler',
-                        'formatter': 'standard',
-                        'level': 'INFO',
-                    },
-                    'file': {
-                        'class': 'logging.handlers.RotatingFileHandler',
-                        'filename': 'logs/reddit_downloader.log',
-                        'formatter': 'standard',
-                        'level': 'INFO',
-                        'maxBytes': 10485760,  # 10MB
-                        'backupCount': 5,
-                    },
-                },
-                'loggers': {
-                    '': {
-                        'handlers': ['console', 'file'],
-                        'level': 'INFO',
-                        'propagate': True
-                    }
-                }
-            }
+            self.logging_config = _DEFAULT_LOGGING_CONFIG
+        self.validate()
 
     def validate(self) -> None:
         """Validate global configuration."""
-        if not self.output_dir:
-            raise ValidationError("Output directory is required")
-        if self.default_batch_size < 1:
-            raise ValidationError("Default batch size must be greater than 0")
-        if self.default_timeout < 1:
-            raise ValidationError("Default timeout must be greater than 0")
-        if self.max_retries < 0:
-            raise ValidationError("Max retries must be greater than or equal to 0")
-        if self.retry_delay < 0:
-            raise ValidationError("Retry delay must be greater than or equal to 0")
\ No newline at end of file
+        for check, message in _GLOBAL_CHECKS:
+            if not check(self):
+                raise ValidationError(message)
@@ -2,14 +2,15 @@
 from typing import List, Optional, Dict, Any
 import os
 import re
-import requests
+import time
+import asyncio
+import hashlib
+import heapq
 import shutil
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from urllib.parse import urlparse
-import praw
-import yt_dlp
-from openai import OpenAI
 
 from .config import RedditCredentials, SubredditConfig, GlobalConfig
 from .models import RedditPost, DownloadResult
@@ -17,36 +18,178 @@ from .exceptions import (
     InvalidCredentialsError,
     SubredditNotFoundError,
     InvalidFilterTypeError,
-    InvalidTimeFilterError,
     DownloadError
 )
 
+# URL classifiers, compiled once at import
+_YOUTUBE_RE = re.compile(r'(?:https?://)?(?:www\.)?(?:youtube\.com/watch\?v=|youtu\.be/)[\w-]+')
+_REDGIFS_RE = re.compile(r'(?:https?://)?(?:www\.)?redgifs\.com/(?:watch|i)/[\w-]+')
+
+_IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.gif'})
+_VIDEO_EXTENSIONS = frozenset({'.mp4', '.webm', '.mov'})
+
+# Generated summaries are cached here and kept for 30 days
+_SUMMARY_CACHE_DIR = os.path.join('.cache', 'summaries')
+_SUMMARY_CACHE_TTL = 30 * 24 * 60 * 60
+
+# IDs of posts that have already been downloaded, as a JSON list
+_SEEN_POSTS_FILE = os.path.join('.cache', 'seen_posts.json')
+
+# Bytes read per iteration when streaming media to disk
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Maximum number of gallery images downloaded concurrently
+_GALLERY_WORKERS = 8
+
+# File extensions by Content-Type subtype (e.g. image/jpeg -> jpeg)
+_CONTENT_TYPE_EXTENSIONS = {
+    'jpeg': '.jpg',
+    'jpg': '.jpg',
+    'pjpeg': '.jpg',
+    'png': '.png',
+    'gif': '.gif',
+    'mp4': '.mp4',
+    'webm': '.webm',
+}
+
+# Fallback for content types missing from the table above, checked in order
+# as substrings (e.g. "image/vnd.mozilla.apng" -> .png)
+_CONTENT_TYPE_SUBSTRINGS = (
+    ('jpeg', '.jpg'),
+    ('jpg', '.jpg'),
+    ('png', '.png'),
+    ('gif', '.gif'),
+    ('mp4', '.mp4'),
+    ('webm', '.webm'),
+)
+
+# Layout of each comment written to comments.txt
+_COMMENT_TEMPLATE = (
+    "Author: {author}\n"
+    "Created: {created_utc}\n"
+    "Score: {score}\n"
+    "Content:\n"
+    "{body}\n\n" + "-" * 80 + "\n\n"
+)
+
+# Media kinds returned by RedditHandler._classify_url
+_MEDIA_HOSTED = 'hosted'  # YouTube/Imgur/Redgifs, downloaded with yt-dlp
+_MEDIA_IMAGE = 'image'
+_MEDIA_VIDEO = 'video'
+
+# Reddit JSON API endpoints used when use_json_api is enabled
+_REDDIT_TOKEN_URL = 'https://www.reddit.com/api/v1/access_token'
+_REDDIT_OAUTH_URL = 'https://oauth.reddit.com'
+
+# Most posts Reddit returns for one listing request
+_LISTING_PAGE_SIZE = 100
+
+# Maximum number of comment threads fetched concurrently from the JSON API
+_COMMENT_FETCH_CONCURRENCY = 8
+
+# Retries of a rate-limited (HTTP 429) comment request, and the longest
+# Retry-After wait honoured for each
+_RATE_LIMIT_RETRIES = 3
+_MAX_RETRY_AFTER = 60
+
+def _iter_comment_data(listing: Dict[str, Any]):
+    """Yield the data of every comment in a listing, including nested replies."""
+    for child in listing['data']['children']:
+        if child['kind'] != 't1':
+            continue  # Skip 'more' placeholders, like replace_more(limit=0)
+        data = child['data']
+        yield data
+        if data.get('replies'):
+            yield from _iter_comment_data(data['replies'])
+
 class RedditHandler:
     """Handler for Reddit content downloading operations."""
     
-    def __init__(self):
-        """Initialize the Reddit handler with credentials from environment."""
+    def __init__(self, use_json_api: bool = False):
+        """Initialize the Reddit handler with credentials from environment.
+        
+        Args:
+            use_json_api: Fetch listings straight from Reddit's JSON API
+                instead of through PRAW
+        """
         self.logger = logging.getLogger('reddit_handler')
+        self.use_json_api = use_json_api
+        self._oauth_token = None
+        self._oauth_expires_at = 0.0
+        self._date_dir_cache = {}
         self.logger.info("Initializing Reddit API connection")
         
+        # Heavy client libraries are imported on first use rather than at
+        # module import, so config-only users of this package stay fast
+        import diskcache
+        import orjson
+        import requests
+        from openai import OpenAI
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
         try:
-            self.reddit = praw.Reddit(
-                client_id=os.getenv('REDDIT_CLIENT_ID'),
-                client_secret=os.getenv('REDDIT_CLIENT_SECRET'),
-                user_agent=os.getenv('REDDIT_USER_AGENT', 'Python:ContentDownloader:v1.0')
-            )
+            # The JSON API path talks to Reddit directly and never needs PRAW
+            self.reddit = None
+            if not use_json_api:
+                import praw
+                self.reddit = praw.Reddit(
+                    client_id=os.getenv('REDDIT_CLIENT_ID'),
+                    client_secret=os.getenv('REDDIT_CLIENT_SECRET'),
+                    user_agent=os.getenv('REDDIT_USER_AGENT', 'Python:ContentDownloader:v1.0')
+                )
             self.logger.info("Successfully initialized Reddit API connection")
             
             # Initialize OpenAI client
             self.openai_client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
             self.logger.info("Successfully initialized OpenAI client")
             
-            # Configure yt-dlp
-            self.ydl_opts = {
+            # On-disk cache of generated summaries (safe across threads)
+            self.summary_cache = diskcache.Cache(_SUMMARY_CACHE_DIR)
+            
+            # IDs of posts already downloaded by earlier runs
+            self._seen_posts = set()
+            if os.path.exists(_SEEN_POSTS_FILE):
+                try:
+                    with open(_SEEN_POSTS_FILE, 'rb') as f:
+                        self._seen_posts = set(orjson.loads(f.read()))
+                    self.logger.info(f"Loaded {len(self._seen_posts)} already processed post IDs")
+                except (OSError, ValueError, TypeError) as e:
+                    self.logger.warning(f"Ignoring unreadable {_SEEN_POSTS_FILE}: {str(e)}")
+            
+            # Shared HTTP session so media downloads reuse pooled connections
+            # instead of paying a TCP+TLS handshake per file
+            self.http = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=16,
+                pool_maxsize=32,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.3,
+                    status_forcelist=[429, 500, 502, 503, 504]
+                )
+            )
+            self.http.mount('https://', adapter)
+            self.http.mount('http://', adapter)
+            
+            # Listing fetchers by filter type
+            self._filter_dispatch = {
+                'hot': lambda s, c: s.hot(limit=c.limit),
+                'new': lambda s, c: s.new(limit=c.limit),
+                'top': lambda s, c: s.top(time_filter=c.time_filter, limit=c.limit),
+                'rising': lambda s, c: s.rising(limit=c.limit),
+            }
+            
+            # Configure yt-dlp for downloads (full per-entry extraction; flat
+            # extraction would skip the media itself)
+            self.ydl_download_opts = {
                 'format': 'best',
                 'quiet': True,
                 'no_warnings': True,
-                'extract_flat': True
+                'noplaylist': True,
+                'concurrent_fragment_downloads': 4,
+                'retries': 3,
+                'fragment_retries': 3
             }
             
         except Exception as e:
@@ -54,7 +197,17 @@ class RedditHandler:
             raise InvalidCredentialsError(f"Failed to initialize Reddit: {str(e)}")
 
     def _generate_summary(self, title: str, comments: str) -> str:
-        """Generate a summary of the post using OpenAI."""
+        """Generate a summary of the post using OpenAI.
+        
+        Summaries are cached on disk by a hash of the title and comments, so
+        re-runs over the same post skip the API call.
+        """
+        cache_key = hashlib.sha256(f"{title}\0{comments}".encode('utf-8')).hexdigest()
+        cached = self.summary_cache.get(cache_key)
+        if cached is not None:
+            self.logger.info("Using cached summary")
+            return cached
+        
         try:
             # Modified prompt to ensure shorter output
             prompt = f"""Write a very brief 1-2 sentence summary (max 250 characters) of this reddit post and its comments. 
@@ -79,6 +232,7 @@ class RedditHandler:
             if len(summary) > 250:
                 summary = summary[:247] + "..."
             
+            self.summary_cache.set(cache_key, summary, expire=_SUMMARY_CACHE_TTL)
             return summary
             
         except Exception as e:
@@ -86,20 +240,36 @@ class RedditHandler:
             # Return truncated title as fallback
             return f"{title[:247]}..." if len(title) > 250 else title
 
+    def _write_text_file(self, path: str, text: str) -> None:
+        """Write a small UTF-8 text file with raw os-level calls.
+        
+        Skips the buffered TextIOWrapper that open() sets up, which is
+        pure overhead for files written in one go.
+        """
+        data = memoryview(text.encode('utf-8'))
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
+
     def _get_date_based_dir(self, base_dir: str) -> str:
         """Get date-based directory path."""
-        current_date = datetime.now().strftime('%Y-%m-%d')
-        date_dir = os.path.join(base_dir, current_date)
-        os.makedirs(date_dir, exist_ok=True)
+        key = (base_dir, datetime.now().strftime('%Y-%m-%d'))
+        date_dir = self._date_dir_cache.get(key)
+        if date_dir is None:
+            # Only the first post of the day pays for the makedirs; later
+            # post directories are created with makedirs too, so a removed
+            # date directory is still recreated
+            date_dir = os.path.join(*key)
+            os.makedirs(date_dir, exist_ok=True)
+            self._date_dir_cache[key] = date_dir
         return date_dir
 
     def _is_youtube_url(self, url: str) -> bool:
         """Check if URL is from YouTube."""
-        youtube_patterns = [
-            r'(?:https?://)?(?:www\.)?youtube\.com/watch\?v=[\w-]+',
-            r'(?:https?://)?(?:www\.)?youtu\.be/[\w-]+'
-        ]
-        return any(re.match(pattern, url) for pattern in youtube_patterns)
+        return _YOUTUBE_RE.match(url) is not None
     
     def _is_imgur_url(self, url: str) -> bool:
         """Check if URL is from Imgur."""
@@ -107,18 +277,16 @@ class RedditHandler:
     
     def _is_redgifs_url(self, url: str) -> bool:
         """Check if URL is from Redgifs."""
-        redgifs_patterns = [
-            r'(?:https?://)?(?:www\.)?redgifs\.com/watch/[\w-]+',
-            r'(?:https?://)?(?:www\.)?redgifs\.com/i/[\w-]+'
-        ]
-        return any(re.match(pattern, url) for pattern in redgifs_patterns) or 'redgifs.com' in url
+        return _REDGIFS_RE.match(url) is not None or 'redgifs.com' in url
 
     def _download_with_yt_dlp(self, url: str, output_dir: str, post_id: str) -> Optional[str]:
         """Download media using yt-dlp."""
+        import yt_dlp  # Imports hundreds of extractor modules; load on demand
+        
         try:
             output_template = os.path.join(output_dir, f"{post_id}.%(ext)s")
             ydl_opts = {
-                **self.ydl_opts,
+                **self.ydl_download_opts,
                 'outtmpl': output_template
             }
             
@@ -135,26 +303,26 @@ class RedditHandler:
         """Get posts from a subreddit based on configuration."""
         self.logger.info(f"Fetching posts from r/{config.name}")
         
+        if self.use_json_api:
+            return self._get_subreddit_posts_json(config)
+        
+        import praw  # Already loaded by __init__; needed for its exceptions
+        
         try:
             subreddit = self.reddit.subreddit(config.name)
             
-            # Get posts based on filter type
-            if config.filter_type == 'hot':
-                posts = subreddit.hot(limit=config.limit)
-            elif config.filter_type == 'new':
-                posts = subreddit.new(limit=config.limit)
-            elif config.filter_type == 'top':
-                if not config.time_filter:
-                    raise InvalidTimeFilterError("Time filter is required for top posts")
-                posts = subreddit.top(time_filter=config.time_filter, limit=config.limit)
-            elif config.filter_type == 'rising':
-                posts = subreddit.rising(limit=config.limit)
-            else:
+            # Get posts based on filter type (validated by SubredditConfig)
+            fetch_posts = self._filter_dispatch.get(config.filter_type)
+            if fetch_posts is None:
                 raise InvalidFilterTypeError(f"Invalid filter type: {config.filter_type}")
+            posts = fetch_posts(subreddit, config)
             
             # Convert PRAW submissions to our RedditPost model
             reddit_posts = []
             for post in posts:
+                if post.id in self._seen_posts:
+                    self.logger.info(f"Skipping already processed submission {post.id}")
+                    continue
                 self.logger.info(f"Converting submission {post.id}")
                 reddit_post = self._convert_submission_to_post(post, config)
                 reddit_posts.append(reddit_post)
@@ -166,8 +334,188 @@ class RedditHandler:
             self.logger.error(f"Error fetching posts: {str(e)}")
             raise SubredditNotFoundError(f"Error accessing subreddit: {str(e)}")
 
+    def _get_subreddit_posts_json(self, config: SubredditConfig) -> List[RedditPost]:
+        """Get posts from a subreddit via Reddit's JSON API."""
+        import httpx
+        
+        if config.filter_type not in self._filter_dispatch:
+            raise InvalidFilterTypeError(f"Invalid filter type: {config.filter_type}")
+        
+        try:
+            reddit_posts = asyncio.run(self._fetch_listing(config))
+        except httpx.HTTPError as e:
+            self.logger.error(f"Error fetching posts: {str(e)}")
+            raise SubredditNotFoundError(f"Error accessing subreddit: {str(e)}")
+        
+        self.logger.info(f"Found {len(reddit_posts)} posts")
+        return reddit_posts
+
+    async def _get_access_token(self, client: Any) -> str:
+        """Get an app-only OAuth token, reusing it until shortly before expiry."""
+        import orjson
+        
+        if self._oauth_token and time.monotonic() < self._oauth_expires_at:
+            return self._oauth_token
+        
+        response = await client.post(
+            _REDDIT_TOKEN_URL,
+            data={'grant_type': 'client_credentials'},
+            auth=(os.getenv('REDDIT_CLIENT_ID'), os.getenv('REDDIT_CLIENT_SECRET'))
+        )
+        response.raise_for_status()
+        payload = orjson.loads(response.content)
+        self._oauth_token = payload['access_token']
+        self._oauth_expires_at = time.monotonic() + payload.get('expires_in', 3600) - 60
+        return self._oauth_token
+
+    async def _fetch_listing(self, config: SubredditConfig) -> List[RedditPost]:
+        """Fetch a subreddit listing, and its comments, from the JSON API.
+        
+        Listing pages (up to 100 posts each) return every post's metadata
+        inline; comment threads are then fetched concurrently, a few at a
+        time.
+        """
+        import httpx
+        import orjson
+        
+        params = {'raw_json': 1}
+        if config.filter_type == 'top':
+            params['t'] = config.time_filter
+        
+        async with httpx.AsyncClient(
+            base_url=_REDDIT_OAUTH_URL,
+            headers={'User-Agent': os.getenv('REDDIT_USER_AGENT', 'Python:ContentDownloader:v1.0')},
+            timeout=config.timeout
+        ) as client:
+            token = await self._get_access_token(client)
+            client.headers['Authorization'] = f"bearer {token}"
+            
+            # Reddit returns at most 100 posts per request, so page through
+            # the listing with its 'after' cursor like PRAW does
+            children = []
+            after = None
+            while len(children) < config.limit:
+                params['limit'] = min(_LISTING_PAGE_SIZE, config.limit - len(children))
+                if after:
+                    params['after'] = after
+                response = await client.get(f"/r/{config.name}/{config.filter_type}", params=params)
+                response.raise_for_status()
+                listing = orjson.loads(response.content)['data']
+                children.extend(listing['children'])
+                after = listing.get('after')
+                if not after or not listing['children']:
+                    break
+            
+            posts_data = [
+                child['data'] for child in children[:config.limit]
+                if child['kind'] == 't3' and child['data']['id'] not in self._seen_posts
+            ]
+            
+            if config.download_comments and config.max_comments > 0:
+                semaphore = asyncio.Semaphore(_COMMENT_FETCH_CONCURRENCY)
+                comments = await asyncio.gather(
+                    *(self._fetch_comments(client, semaphore, data['id'], config) for data in posts_data)
+                )
+            else:
+                comments = [[] for _ in posts_data]
+        
+        return [
+            self._convert_listing_data_to_post(data, post_comments)
+            for data, post_comments in zip(posts_data, comments)
+        ]
+
+    async def _fetch_comments(self, client: Any, semaphore: asyncio.Semaphore, post_id: str,
+                              config: SubredditConfig) -> List[Dict[str, Any]]:
+        """Fetch the top comments of a post from the JSON API.
+        
+        Rate-limited requests are retried after Reddit's Retry-After delay.
+        Any other failure is logged and the post gets no comments, so one
+        bad thread doesn't fail the whole subreddit.
+        """
+        import httpx
+        import orjson
+        
+        self.logger.info(f"Processing comments for submission {post_id}")
+        try:
+            async with semaphore:
+                for attempt in range(_RATE_LIMIT_RETRIES + 1):
+                    response = await client.get(f"/comments/{post_id}", params={'sort': 'top', 'raw_json': 1})
+                    if response.status_code != 429 or attempt == _RATE_LIMIT_RETRIES:
+                        break
+                    try:
+                        delay = min(float(response.headers.get('retry-after', 1)), _MAX_RETRY_AFTER)
+                    except ValueError:
+                        delay = 1.0
+                    self.logger.warning(f"Rate limited fetching comments for {post_id}, retrying in {delay:g}s")
+                    await asyncio.sleep(delay)
+                response.raise_for_status()
+            comment_listing = orjson.loads(response.content)[1]
+            
+            # Take only the top N comments by score, skipping stickied ones
+            top_comments = heapq.nlargest(
+                config.max_comments,
+                (data for data in _iter_comment_data(comment_listing) if not data.get('stickied')),
+                key=lambda x: x['score']
+            )
+        except (httpx.HTTPError, ValueError, LookupError) as e:
+            self.logger.error(f"Error fetching comments for submission {post_id}: {str(e)}")
+            return []
+        
+        return [
+            {
+                'author': data.get('author') or '[deleted]',
+                'body': data.get('body', ''),
+                'created_utc': datetime.fromtimestamp(data['created_utc']),
+                'score': data['score']
+            }
+            for data in top_comments
+        ]
+
+    def _convert_listing_data_to_post(self, data: Dict[str, Any], comments: List[Dict[str, Any]]) -> RedditPost:
+        """Convert a JSON API listing entry to our RedditPost model."""
+        return RedditPost(
+            id=data['id'],
+            title=data['title'],
+            author=data.get('author') or '[deleted]',
+            created_utc=datetime.fromtimestamp(data['created_utc']),
+            score=data['score'],
+            url=data.get('url'),
+            selftext=data.get('selftext', ''),
+            subreddit=data['subreddit'],
+            comments=comments,
+            is_gallery=bool(data.get('is_gallery')),
+            gallery_data=data.get('gallery_data')
+        )
+
+    def save_seen_posts(self) -> None:
+        """Persist the IDs of processed posts so later runs skip them."""
+        import orjson
+        
+        # Write to a temporary file and rename it over the old one, so an
+        # interrupted write can't leave a truncated file behind
+        os.makedirs(os.path.dirname(_SEEN_POSTS_FILE), exist_ok=True)
+        tmp_path = f"{_SEEN_POSTS_FILE}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(orjson.dumps(list(self._seen_posts)))
+        os.replace(tmp_path, _SEEN_POSTS_FILE)
+
     def download_content(self, post: RedditPost, output_dir: str, config: SubredditConfig) -> DownloadResult:
-        """Download post content including media and comments."""
+        """Download post content including media and comments.
+        
+        Posts whose media was saved, or that have no media to save, are
+        remembered and skipped by later get_subreddit_posts calls (see
+        save_seen_posts). Posts whose media download failed are not, so a
+        later run retries them.
+        """
+        # Classify the media up front so posts that will be skipped anyway
+        # don't cost any disk writes or a summary request
+        media_kind = self._classify_url(post.url) if post.url else None
+        expects_media = media_kind is not None or self._is_gallery(post)
+        if config.skip_no_media and not expects_media:
+            self.logger.info(f"No media found for post {post.id}, skipping")
+            self._seen_posts.add(post.id)
+            return DownloadResult(success=True, downloaded_files=[], errors=[])
+        
         # Create date-based directory
         date_dir = self._get_date_based_dir(output_dir)
         post_dir = os.path.join(date_dir, f"{post.subreddit}_{post.id}")
@@ -179,51 +527,45 @@ class RedditHandler:
         
         try:
             # Save post information
+            post_info = (
+                f"Title: {post.title}\n"
+                f"Author: {post.author}\n"
+                f"Created: {post.created_utc}\n"
+                f"Score: {post.score}\n"
+                f"URL: {post.url}\n\n"
+            )
+            if post.selftext:
+                post_info += f"Content:\n{post.selftext}"
             post_info_path = os.path.join(post_dir, "post_info.txt")
-            with open(post_info_path, 'w', encoding='utf-8') as f:
-                f.write(f"Title: {post.title}\n")
-                f.write(f"Author: {post.author}\n")
-                f.write(f"Created: {post.created_utc}\n")
-                f.write(f"Score: {post.score}\n")
-                f.write(f"URL: {post.url}\n\n")
-                if post.selftext:
-                    f.write("Content:\n")
-                    f.write(post.selftext)
+            self._write_text_file(post_info_path, post_info)
             downloaded_files.append(post_info_path)
             
             # Save title to separate file
             title_path = os.path.join(post_dir, "title.txt")
-            with open(title_path, 'w', encoding='utf-8') as f:
-                f.write(post.title)
+            self._write_text_file(title_path, post.title)
             downloaded_files.append(title_path)
             
             # Save URL to separate file
             url_path = os.path.join(post_dir, "url.txt")
-            with open(url_path, 'w', encoding='utf-8') as f:
-                f.write(post.url)
+            self._write_text_file(url_path, post.url)
             downloaded_files.append(url_path)
             
             # Save comments if enabled
             if config.download_comments and post.comments:
                 comments_path = os.path.join(post_dir, "comments.txt")
-                comments_content = ""
+                comment_parts = []
                 with open(comments_path, 'w', encoding='utf-8') as f:
                     for comment in post.comments:
-                        comment_text = f"Author: {comment['author']}\n"
-                        comment_text += f"Created: {comment['created_utc']}\n"
-                        comment_text += f"Score: {comment['score']}\n"
-                        comment_text += "Content:\n"
-                        comment_text += comment['body']
-                        comment_text += "\n\n" + "-"*80 + "\n\n"
+                        comment_text = _COMMENT_TEMPLATE.format_map(comment)
                         f.write(comment_text)
-                        comments_content += comment_text
+                        comment_parts.append(comment_text)
+                comments_content = "".join(comment_parts)
                 downloaded_files.append(comments_path)
                 
                 # Generate and save summary using OpenAI
                 summary = self._generate_summary(post.title, comments_content)
                 summary_path = os.path.join(post_dir, "post-summary.txt")
-                with open(summary_path, 'w', encoding='utf-8') as f:
-                    f.write(summary)
+                self._write_text_file(summary_path, summary)
                 downloaded_files.append(summary_path)
             
             # Download media if present
@@ -233,26 +575,24 @@ class RedditHandler:
                 
                 try:
                     # Handle special media types first
-                    if (self._is_youtube_url(post.url) or 
-                        self._is_imgur_url(post.url) or 
-                        self._is_redgifs_url(post.url)):
+                    if media_kind == _MEDIA_HOSTED:
                         file_path = self._download_with_yt_dlp(post.url, media_dir, post.id)
                         if file_path:
                             downloaded_files.append(file_path)
                             has_media = True
                     # Handle standard media types
-                    elif self._is_image_url(post.url):
-                        file_path = self._download_image(post.url, media_dir, post.id)
+                    elif media_kind == _MEDIA_IMAGE:
+                        file_path = self._download_image(post.url, media_dir, post.id, config.timeout)
                         if file_path:
                             downloaded_files.append(file_path)
                             has_media = True
                     elif self._is_gallery(post):
-                        gallery_files = self._download_gallery(post, media_dir)
+                        gallery_files = self._download_gallery(post, media_dir, config.timeout)
                         if gallery_files:
                             downloaded_files.extend(gallery_files)
                             has_media = True
-                    elif self._is_video(post.url):
-                        file_path = self._download_video(post.url, media_dir, post.id)
+                    elif media_kind == _MEDIA_VIDEO:
+                        file_path = self._download_video(post.url, media_dir, post.id, config.timeout)
                         if file_path:
                             downloaded_files.append(file_path)
                             has_media = True
@@ -266,6 +606,8 @@ class RedditHandler:
                 shutil.rmtree(post_dir)
                 return DownloadResult(success=True, downloaded_files=[], errors=[])
             
+            if has_media or not expects_media:
+                self._seen_posts.add(post.id)
             return DownloadResult(success=True, downloaded_files=downloaded_files, errors=errors)
             
         except Exception as e:
@@ -285,15 +627,12 @@ class RedditHandler:
             self.logger.info(f"Processing comments for submission {submission.id}")
             submission.comments.replace_more(limit=0)  # Remove MoreComments objects
             
-            # Get all top-level comments and sort by score
-            all_comments = [
-                comment for comment in submission.comments.list()
-                if not comment.stickied  # Skip stickied comments
-            ]
-            all_comments.sort(key=lambda x: x.score, reverse=True)  # Sort by score descending
-            
-            # Take only the top N comments
-            top_comments = all_comments[:config.max_comments]
+            # Take only the top N comments by score, skipping stickied ones
+            top_comments = heapq.nlargest(
+                config.max_comments,
+                (comment for comment in submission.comments.list() if not comment.stickied),
+                key=lambda x: x.score
+            )
             self.logger.info(f"Processing {len(top_comments)} top comments")
             
             for comment in top_comments:
@@ -309,6 +648,11 @@ class RedditHandler:
             
             self.logger.info(f"Processed {len(comments)} comments")
         
+        # Read optional fields from the listing data directly: hasattr() on
+        # an attribute the listing didn't include makes PRAW fetch the whole
+        # submission again, one HTTP request per non-gallery post
+        attrs = vars(submission)
+        
         return RedditPost(
             id=submission.id,
             title=submission.title,
@@ -319,30 +663,33 @@ class RedditHandler:
             selftext=submission.selftext,
             subreddit=submission.subreddit.display_name,
             comments=comments,
-            is_gallery=hasattr(submission, 'is_gallery') and submission.is_gallery,
-            gallery_data=submission.gallery_data if hasattr(submission, 'gallery_data') else None
+            is_gallery=bool(attrs.get('is_gallery')),
+            gallery_data=attrs.get('gallery_data')
         )
 
-    def _is_image_url(self, url: str) -> bool:
-        """Check if URL points to an image."""
-        image_extensions = ['.jpg', '.jpeg', '.png', '.gif']
-        parsed_url = urlparse(url)
-        return any(parsed_url.path.lower().endswith(ext) for ext in image_extensions)
+    def _url_extension(self, url: str) -> str:
+        """Get the lowercased file extension of a URL's path."""
+        return os.path.splitext(urlparse(url).path)[1].lower()
+
+    def _classify_url(self, url: str) -> Optional[str]:
+        """Classify a URL as hosted media, an image or a video in one pass."""
+        if self._is_youtube_url(url) or self._is_imgur_url(url) or self._is_redgifs_url(url):
+            return _MEDIA_HOSTED
+        ext = self._url_extension(url)
+        if ext in _IMAGE_EXTENSIONS:
+            return _MEDIA_IMAGE
+        if ext in _VIDEO_EXTENSIONS:
+            return _MEDIA_VIDEO
+        return None
 
     def _is_gallery(self, post: RedditPost) -> bool:
         """Check if post is a gallery."""
         return post.is_gallery and post.gallery_data is not None
 
-    def _is_video(self, url: str) -> bool:
-        """Check if URL points to a video."""
-        video_extensions = ['.mp4', '.webm', '.mov']
-        parsed_url = urlparse(url)
-        return any(parsed_url.path.lower().endswith(ext) for ext in video_extensions)
-
-    def _download_image(self, url: str, output_dir: str, post_id: str) -> Optional[str]:
+    def _download_image(self, url: str, output_dir: str, post_id: str, timeout: int = 30) -> Optional[str]:
         """Download an image file."""
         try:
-            response = requests.get(url, stream=True)
+            response = self.http.get(url, stream=True, timeout=timeout)
             if response.status_code == 200:
                 content_type = response.headers.get('content-type', '')
                 ext = self._get_extension_from_content_type(content_type)
@@ -355,34 +702,43 @@ class RedditHandler:
                 filepath = os.path.join(output_dir, filename)
                 
                 with open(filepath, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        if chunk:
-                            f.write(chunk)
+                    for chunk in response.iter_content(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
                 
                 return filepath
         except Exception as e:
             self.logger.error(f"Error downloading image: {str(e)}")
         return None
 
-    def _download_gallery(self, post: RedditPost, output_dir: str) -> List[str]:
+    def _download_gallery(self, post: RedditPost, output_dir: str, timeout: int = 30) -> List[str]:
         """Download all images from a gallery post."""
         downloaded_files = []
         try:
             if post.gallery_data:
-                for item in post.gallery_data['items']:
-                    media_id = item['media_id']
-                    url = f"https://i.redd.it/{media_id}.jpg"
-                    file_path = self._download_image(url, output_dir, f"{post.id}_{media_id}")
-                    if file_path:
-                        downloaded_files.append(file_path)
+                items = post.gallery_data['items']
+                if not items:
+                    return downloaded_files
+                urls = [f"https://i.redd.it/{item['media_id']}.jpg" for item in items]
+                names = [f"{post.id}_{item['media_id']}" for item in items]
+                
+                # Fetch gallery images concurrently; results keep gallery order
+                with ThreadPoolExecutor(max_workers=min(_GALLERY_WORKERS, len(items))) as executor:
+                    downloads = executor.map(
+                        lambda url, name: self._download_image(url, output_dir, name, timeout),
+                        urls,
+                        names
+                    )
+                    for file_path in downloads:
+                        if file_path:
+                            downloaded_files.append(file_path)
         except Exception as e:
             self.logger.error(f"Error downloading gallery: {str(e)}")
         return downloaded_files
 
-    def _download_video(self, url: str, output_dir: str, post_id: str) -> Optional[str]:
+    def _download_video(self, url: str, output_dir: str, post_id: str, timeout: int = 30) -> Optional[str]:
         """Download a video file."""
         try:
-            response = requests.get(url, stream=True)
+            response = self.http.get(url, stream=True, timeout=timeout)
             if response.status_code == 200:
                 ext = os.path.splitext(urlparse(url).path)[1]
                 if not ext:
@@ -392,9 +748,8 @@ class RedditHandler:
                 filepath = os.path.join(output_dir, filename)
                 
                 with open(filepath, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        if chunk:
-                            f.write(chunk)
+                    for chunk in response.iter_content(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
                 
                 return filepath
         except Exception as e:
@@ -404,14 +759,14 @@ class RedditHandler:
     def _get_extension_from_content_type(self, content_type: str) -> str:
         """Get file extension from content type."""
         content_type = content_type.lower()
-        if 'jpeg' in content_type or 'jpg' in content_type:
-            return '.jpg'
-        elif 'png' in content_type:
-            return '.png'
-        elif 'gif' in content_type:
-            return '.gif'
-        elif 'mp4' in content_type:
-            return '.mp4'
-        elif 'webm' in content_type:
-            return '.webm'
+        subtype = content_type.split('/', 1)[-1].split(';', 1)[0].strip()
+        if subtype.startswith('x-'):
+            subtype = subtype[2:]  # e.g. image/x-png
+        ext = _CONTENT_TYPE_EXTENSIONS.get(subtype)
+        if ext is not None:
+            return ext
+        # Anything unusual falls back to a substring scan of the whole header
+        for name, ext in _CONTENT_TYPE_SUBSTRINGS:
+            if name in content_type:
+                return ext
         return ''
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 
-@dataclass
+@dataclass(slots=True)
 class RedditComment:
     """Model representing a Reddit comment."""
     id: str
@@ -13,7 +13,7 @@ class RedditComment:
     parent_id: str
     is_submitter: bool
 
-@dataclass
+@dataclass(slots=True)
 class RedditMedia:
     """Model representing media content from a Reddit post."""
     url: str
@@ -23,7 +23,7 @@ class RedditMedia:
     width: Optional[int] = None
     height: Optional[int] = None
 
-@dataclass
+@dataclass(slots=True)
 class RedditPost:
     """Model representing a Reddit post."""
     id: str
@@ -38,7 +38,7 @@ class RedditPost:
     is_gallery: bool
     gallery_data: Optional[Dict[str, Any]]
 
-@dataclass
+@dataclass(slots=True)
 class DownloadResult:
     """Model representing the result of a download operation."""
     success: bool
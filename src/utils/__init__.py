@@ -2,6 +2,7 @@
 
 from .validators import (
     validate_subreddit_name,
+    validate_subreddit_names,
     validate_filter_type,
     validate_time_filter,
     validate_limit,
@@ -10,5 +11,7 @@ from .validators import (
     validate_timeout,
     validate_file_path,
     validate_media_type,
-    validate_url
-)
\ No newline at end of file
+    validate_url,
+    validate_urls
+)
+from .logging_utils import setup_file_logger
@@ -0,0 +1,34 @@
+"""Logging helpers shared by the pipeline's entry-point scripts."""
+import logging
+import os
+from typing import Optional, TextIO
+
+# Same record layout as the logging configuration in config.yaml
+_LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+def setup_file_logger(name: str, path: str, stream: Optional[TextIO] = None) -> logging.Logger:
+    """Get a logger that writes to its own log file and a console stream.
+    
+    The logger has its own handlers and doesn't propagate to the root
+    logger: main.py runs the scripts in one process, and reddit_main
+    replaces the root handlers with its dictConfig, so a script logging
+    through the root logger would lose its log file. Calling this again
+    for the same name doesn't add duplicate handlers.
+    
+    Args:
+        name: Logger name
+        path: Log file path; its directory is created if needed
+        stream: Console stream (defaults to stderr)
+    """
+    logger = logging.getLogger(name)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    if not logger.handlers:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        formatter = logging.Formatter(_LOG_FORMAT)
+        for handler in (logging.FileHandler(path), logging.StreamHandler(stream)):
+            handler.setFormatter(formatter)
+            logger.addHandler(handler)
+    return logger
@@ -1,129 +1,312 @@
+import functools
+import ipaddress
 import os
 import re
-from typing import Optional
+from typing import List, Optional
+from urllib.parse import urlsplit
+from src.reddit.config import (
+    FILTER_TYPES,
+    TIME_FILTERS,
+    VALID_FILTER_TYPES,
+    VALID_TIME_FILTERS
+)
 from src.reddit.exceptions import ValidationError
 
+# Prefer RE2's linear-time engine when google-re2 is installed
+try:
+    import re2 as _hostname_re
+except ImportError:
+    _hostname_re = re
+
+# Filter types are string literals in config.py, so they are already
+# interned and can be compared by identity
+_HOT, _NEW, _TOP, _RISING = FILTER_TYPES
+_VALID_MEDIA_TYPES = frozenset((
+    'image/jpeg', 'image/png', 'image/gif',
+    'video/mp4', 'video/webm',
+    'application/octet-stream'  # For unknown types
+))
+
+# Error messages built once at import time
+_FILTER_TYPE_ERR = f"Invalid filter type. Must be one of: {', '.join(FILTER_TYPES)}"
+_TIME_FILTER_ERR = f"Invalid time filter. Must be one of: {', '.join(TIME_FILTERS)}"
+
+# Longest path accepted before touching the filesystem (Linux PATH_MAX)
+_MAX_PATH_LENGTH = 4096
+
+# Output directories that have already passed validate_output_directory
+_VALIDATED_OUTPUT_DIRS = set()
+
+# Reddit subreddit naming rules
+# (3-21 ASCII letters, digits or underscores, not starting with '_'). Valid
+# bytes are deleted with bytes.translate, so anything left over is invalid.
+_SUBREDDIT_CHARS = (b'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+                    b'abcdefghijklmnopqrstuvwxyz0123456789_')
+
+_SUBREDDIT_NAME_ERR = (
+    "Invalid subreddit name. Must be 3-21 characters, "
+    "start with letter/number, and contain only letters, numbers, or underscores"
+)
+
+# Same rules as a multiline pattern, for checking many names in one scan
+_BATCH_SUBREDDIT_RE = re.compile(r'^[A-Za-z0-9][A-Za-z0-9_]{2,20}$',
+                                 re.ASCII | re.MULTILINE)
+
+# Basic URL validation. Only the hostname is matched against a regex; the
+# rest of the URL is handled by cheap string checks and urlsplit, so no
+# pattern runs over attacker-controlled path text.
+_MAX_URL_LENGTH = 2048
+_VALID_SCHEMES = ('http://', 'https://')
+_WHITESPACE_RE = re.compile(r'\s')
+# Domain names only; localhost and IP addresses are handled separately.
+# Spelled with explicit ASCII classes and no flags so it behaves the same
+# under RE2 and the stdlib re (and non-ASCII look-alikes never match).
+_HOSTNAME_RE = _hostname_re.compile(
+    r'(?:[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?\.)+[A-Za-z]{2,6}\.?')
+
+# Results of the pure validators, keyed on arguments plus their types (so
+# 1 and 1.0 or True don't share an entry). Values are None for a pass or the
+# error message for a failure.
+_RESULT_CACHE_SIZE = 1024
+_result_cache = {}
+
+def _cached(func):
+    """Memoize a pure validator, re-raising cached failures."""
+    @functools.wraps(func)
+    def wrapper(*args):
+        key = (func, args, tuple(map(type, args)))
+        try:
+            message = _result_cache[key]
+        except KeyError:
+            pass
+        except TypeError:  # Unhashable argument, validate without caching
+            return func(*args)
+        else:
+            if message is not None:
+                raise ValidationError(message)
+            return None
+        
+        try:
+            func(*args)
+        except ValidationError as e:
+            if len(_result_cache) < _RESULT_CACHE_SIZE:
+                _result_cache[key] = str(e)
+            raise
+        if len(_result_cache) < _RESULT_CACHE_SIZE:
+            _result_cache[key] = None
+        return None
+    return wrapper
+
+def _make_int_range_validator(func_name: str, lo: int, hi: int, doc: str,
+                               not_int: str, too_low: str, too_high: str):
+    """Build a validator checking that a value is an integer within [lo, hi].
+    
+    Bounds and error messages are bound once in the closure rather than
+    passed to a shared helper on every call.
+    """
+    def validator(value: int) -> None:
+        # Fast path: one type identity check and a chained comparison
+        if type(value) is int and lo <= value <= hi:
+            return
+        if not isinstance(value, int):
+            raise ValidationError(not_int)
+        if value < lo:
+            raise ValidationError(too_low)
+        if value > hi:
+            raise ValidationError(too_high)
+    
+    validator.__name__ = validator.__qualname__ = func_name
+    validator.__doc__ = doc
+    return _cached(validator)
+
+@_cached
 def validate_subreddit_name(name: str) -> None:
     """Validate subreddit name format."""
     if not name:
         raise ValidationError("Subreddit name is required")
     
-    # Reddit subreddit naming rules
-    if not re.match(r'^[A-Za-z0-9][A-Za-z0-9_]{2,20}$', name):
-        raise ValidationError(
-            "Invalid subreddit name. Must be 3-21 characters, "
-            "start with letter/number, and contain only letters, numbers, or underscores"
-        )
+    if (not 3 <= len(name) <= 21
+            or name[0] == '_'
+            or name.encode('ascii', 'replace').translate(None, _SUBREDDIT_CHARS)):
+        raise ValidationError(_SUBREDDIT_NAME_ERR)
 
 def validate_filter_type(filter_type: str) -> None:
-    """Validate post filter type."""
-    valid_types = ['hot', 'new', 'top', 'rising']
-    if filter_type not in valid_types:
-        raise ValidationError(f"Invalid filter type. Must be one of: {', '.join(valid_types)}")
+    """Validate post filter type.
+    
+    Not memoized: the identity checks and the frozenset lookup are already
+    cheaper than building a cache key.
+    """
+    # Identity checks first: string literals (and anything passed through
+    # sys.intern) share the interned constants
+    if (filter_type is _HOT or filter_type is _NEW
+            or filter_type is _TOP or filter_type is _RISING):
+        return
+    if filter_type not in VALID_FILTER_TYPES:
+        raise ValidationError(_FILTER_TYPE_ERR)
 
+@_cached
 def validate_time_filter(time_filter: Optional[str], filter_type: str) -> None:
     """Validate time filter for top posts."""
     if filter_type == 'top':
         if not time_filter:
             raise ValidationError("Time filter is required for top posts")
         
-        valid_filters = ['all', 'day', 'hour', 'month', 'week', 'year']
-        if time_filter not in valid_filters:
-            raise ValidationError(f"Invalid time filter. Must be one of: {', '.join(valid_filters)}")
-
-def validate_limit(limit: int) -> None:
-    """Validate post limit."""
-    if not isinstance(limit, int):
-        raise ValidationError("Limit must be an integer")
-    if limit < 1:
-        raise ValidationError("Limit must be at least 1")
-    if limit > 100:
-        raise ValidationError("Limit cannot exceed 100 posts")
+        if time_filter not in VALID_TIME_FILTERS:
+            raise ValidationError(_TIME_FILTER_ERR)
+
+validate_limit = _make_int_range_validator(
+    'validate_limit', 1, 100, "Validate post limit.",
+    "Limit must be an integer",
+    "Limit must be at least 1",
+    "Limit cannot exceed 100 posts")
 
 def validate_output_directory(path: str) -> None:
-    """Validate output directory path."""
+    """Validate output directory path.
+    
+    Paths that validated successfully are remembered, so repeat calls for
+    the same directory only check that it still exists.
+    """
     if not path:
         raise ValidationError("Output directory path is required")
     
+    # Reject obviously bad input before any filesystem calls
+    if not isinstance(path, str) or len(path) > _MAX_PATH_LENGTH:
+        raise ValidationError(f"Invalid output directory: {path!r}")
+    
+    # A cached directory may have been removed since (e.g. by pruning), in
+    # which case it is validated and created again below
+    if path in _VALIDATED_OUTPUT_DIRS and os.path.isdir(path):
+        return
+    
     try:
         # Create directory if it doesn't exist
         os.makedirs(path, exist_ok=True)
-        
-        # Check if directory is writable
-        test_file = os.path.join(path, '.test')
-        try:
-            with open(test_file, 'w') as f:
-                f.write('test')
-            os.remove(test_file)
-        except (IOError, OSError) as e:
-            raise ValidationError(f"Output directory is not writable: {str(e)}")
-            
-    except Exception as e:
-        raise ValidationError(f"Invalid output directory: {str(e)}")
-
-def validate_batch_size(batch_size: int) -> None:
-    """Validate comment processing batch size."""
-    if not isinstance(batch_size, int):
-        raise ValidationError("Batch size must be an integer")
-    if batch_size < 1:
-        raise ValidationError("Batch size must be at least 1")
-    if batch_size > 100:
-        raise ValidationError("Batch size cannot exceed 100")
-
-def validate_timeout(timeout: int) -> None:
-    """Validate operation timeout."""
-    if not isinstance(timeout, int):
-        raise ValidationError("Timeout must be an integer")
-    if timeout < 1:
-        raise ValidationError("Timeout must be at least 1 second")
-    if timeout > 300:  # 5 minutes max
-        raise ValidationError("Timeout cannot exceed 300 seconds (5 minutes)")
+    except OSError as e:
+        raise ValidationError(f"Invalid output directory: {path}") from e
+    
+    # Check if directory is writable (a single access() call instead of
+    # creating and removing a probe file)
+    if not os.access(path, os.W_OK):
+        raise ValidationError(f"Output directory is not writable: {path}")
+    
+    _VALIDATED_OUTPUT_DIRS.add(path)
+
+validate_batch_size = _make_int_range_validator(
+    'validate_batch_size', 1, 100, "Validate comment processing batch size.",
+    "Batch size must be an integer",
+    "Batch size must be at least 1",
+    "Batch size cannot exceed 100")
+
+# Timeout is in seconds, 5 minutes max
+validate_timeout = _make_int_range_validator(
+    'validate_timeout', 1, 300, "Validate operation timeout.",
+    "Timeout must be an integer",
+    "Timeout must be at least 1 second",
+    "Timeout cannot exceed 300 seconds (5 minutes)")
 
 def validate_file_path(path: str) -> None:
     """Validate file path for writing."""
     if not path:
         raise ValidationError("File path is required")
     
-    try:
-        # Create directory if it doesn't exist
-        directory = os.path.dirname(path)
-        if directory:
-            os.makedirs(directory, exist_ok=True)
-            
-        # Check if path is writable
+    # Create directory if it doesn't exist
+    directory = os.path.dirname(path)
+    if directory:
         try:
-            with open(path, 'a') as f:
-                pass
-        except (IOError, OSError) as e:
-            raise ValidationError(f"File path is not writable: {str(e)}")
-            
-    except Exception as e:
-        raise ValidationError(f"Invalid file path: {str(e)}")
+            os.makedirs(directory, exist_ok=True)
+        except OSError as e:
+            raise ValidationError(f"Invalid file path: {path}") from e
+    
+    if os.path.isdir(path):
+        raise ValidationError(f"File path is a directory: {path}")
+    
+    # Check if path is writable without creating the file: the directory
+    # must allow new entries, and an existing file must itself be writable
+    if not os.access(directory or '.', os.W_OK):
+        raise ValidationError(f"File path is not writable: {path}")
+    if os.path.exists(path) and not os.access(path, os.W_OK):
+        raise ValidationError(f"File path is not writable: {path}")
 
+@_cached
 def validate_media_type(content_type: str) -> None:
-    """Validate media content type."""
-    valid_types = [
-        'image/jpeg', 'image/png', 'image/gif',
-        'video/mp4', 'video/webm',
-        'application/octet-stream'  # For unknown types
-    ]
-    
-    if content_type and content_type.lower() not in valid_types:
+    """Validate media content type.
+    
+    Callers should pass lowercase MIME types; other casings are still
+    accepted but cost an extra lowercase copy.
+    """
+    if not content_type or content_type in _VALID_MEDIA_TYPES:
+        return
+    if content_type.lower() not in _VALID_MEDIA_TYPES:
         raise ValidationError(f"Invalid media type: {content_type}")
 
+@_cached
 def validate_url(url: str) -> None:
     """Validate URL format."""
     if not url:
         raise ValidationError("URL is required")
     
-    # Basic URL validation
-    url_pattern = re.compile(
-        r'^https?://'  # http:// or https://
-        r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
-        r'localhost|'  # localhost...
-        r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
-        r'(?::\d+)?'  # optional port
-        r'(?:/?|[/?]\S+)$', re.IGNORECASE)
-    
-    if not url_pattern.match(url):
-        raise ValidationError("Invalid URL format")
\ No newline at end of file
+    # Cheapest checks first: length, then scheme (exact prefix, falling back
+    # to a case-insensitive compare of the first 8 characters), then the
+    # whitespace scan
+    if (len(url) > _MAX_URL_LENGTH
+            or not (url.startswith(_VALID_SCHEMES)
+                    or url[:8].lower().startswith(_VALID_SCHEMES))
+            or _WHITESPACE_RE.search(url)):
+        raise ValidationError("Invalid URL format")
+    
+    # urlsplit rejects malformed IPv6 brackets and .port a malformed port,
+    # both with ValueError
+    try:
+        parsed = urlsplit(url)
+        parsed.port
+        host = parsed.hostname
+    except ValueError:
+        raise ValidationError("Invalid URL format")
+    
+    netloc = parsed.netloc
+    if not host or '@' in netloc or netloc.endswith(':'):
+        raise ValidationError("Invalid URL format")
+    # Only a port may follow a bracketed IPv6 literal
+    if netloc.startswith('[') and netloc[netloc.find(']') + 1:][:1] not in ('', ':'):
+        raise ValidationError("Invalid URL format")
+    
+    # Anything after the host and port must start a path or query string
+    # (so e.g. 'http://example.com#frag' is rejected)
+    rest = url[len(parsed.scheme) + 3 + len(netloc):]
+    if rest and rest[0] not in '/?':
+        raise ValidationError("Invalid URL format")
+    if host == 'localhost':
+        return
+    try:
+        ipaddress.ip_address(host)
+        return
+    except ValueError:
+        pass
+    if not _HOSTNAME_RE.fullmatch(host):
+        raise ValidationError("Invalid URL format")
+
+def validate_subreddit_names(names: List[str]) -> None:
+    """Validate a batch of subreddit names.
+    
+    The whole batch is checked with one regex scan over the newline-joined
+    names; only when that fails are names checked one at a time to find
+    the offending index.
+    """
+    joined = '\n'.join(names)
+    if (joined.count('\n') == len(names) - 1
+            and len(_BATCH_SUBREDDIT_RE.findall(joined)) == len(names)):
+        return
+    
+    for index, name in enumerate(names):
+        try:
+            validate_subreddit_name(name)
+        except ValidationError as e:
+            raise ValidationError(f"Subreddit name {index} ({name!r}): {e}")
+
+def validate_urls(urls: List[str]) -> None:
+    """Validate a batch of URLs, reporting the index of the first bad one."""
+    for index, url in enumerate(urls):
+        try:
+            validate_url(url)
+        except ValidationError as e:
+            raise ValidationError(f"URL {index} ({url!r}): {e}")
\ No newline at end of file